@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 import numpy as np
 import rust_ephem
 from pydantic import BaseModel, ConfigDict, Field
@@ -43,6 +45,11 @@ class Constraint(BaseModel):
         & ~rust_ephem.EclipseConstraint()
     )
 
+    # Class-level eclipse constraint (stateless, shared across all instances)
+    _eclipse_constraint: ClassVar[rust_ephem.EclipseConstraint] = (
+        rust_ephem.EclipseConstraint()
+    )
+
     ephem: rust_ephem.Ephemeris | None = Field(default=None, exclude=True)
 
     bestroll: float = Field(default=0.0, exclude=True)
@@ -105,7 +112,7 @@ class Constraint(BaseModel):
         # Convert time to datetime for rust-ephem
 
         dt = dtutcfromtimestamp(time)
-        return rust_ephem.EclipseConstraint().in_constraint(
+        return self._eclipse_constraint.in_constraint(
             ephemeris=self.ephem, target_ra=ra, target_dec=dec, time=dt
         )
 
@@ -5,6 +5,8 @@ of the sky with scheduled observations and constraint regions.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 import matplotlib.colors as mcolors
@@ -203,6 +205,7 @@ class SkyPointingController:
     """Controller for interactive sky pointing visualization."""
 
     _constraint_cache: dict[str, Any]
+    _grid_signature: tuple[int, int]
 
     def __init__(
         self,
@@ -539,18 +542,23 @@ class SkyPointingController:
             "Ephemeris must be set for constraint calculations."
         )
 
-        for name, constraint_func in constraint_types:
-            # Batch evaluation with datetime array
-            result = constraint_func.in_constraint_batch(
-                ephemeris=self.ditl.ephem,
-                target_ras=list(ra_flat),
-                target_decs=list(dec_flat),
-                times=times,  # Pass entire array of datetime objects
+        target_ras = list(ra_flat)
+        target_decs = list(dec_flat)
+
+        # Each constraint type is an independent batch evaluation over all
+        # times, so evaluate them concurrently
+        with ThreadPoolExecutor(max_workers=len(constraint_types)) as executor:
+            results = executor.map(
+                lambda item: self._compute_constraint_mask(
+                    item[1], target_ras, target_decs, times
+                ),
+                constraint_types,
             )
-            # Result shape is (n_points, n_times) from rust_ephem
-            constraint_cache[name] = result
+            for (name, _), mask in zip(constraint_types, results):
+                constraint_cache[name] = mask
 
         # Store cache
+        self._grid_signature = (self.n_grid_points, n_points)
         self._constraint_cache = {
             "ra_grid": ra_flat,
             "dec_grid": dec_flat,
@@ -562,6 +570,42 @@ class SkyPointingController:
             f"Constraint pre-computation complete. Cached {len(constraint_types)} constraint types."
         )
 
+    def _compute_constraint_mask(
+        self,
+        constraint_func: rust_ephem.constraints.ConstraintConfig,
+        target_ras: list[float],
+        target_decs: list[float],
+        times: list[datetime],
+    ) -> npt.NDArray[np.bool_]:
+        """Evaluate one constraint over the sky grid for all cached times.
+
+        Parameters
+        ----------
+        constraint_func : ConstraintConfig
+            Constraint to evaluate.
+        target_ras : list of float
+            RA values of the sky grid in degrees.
+        target_decs : list of float
+            Dec values of the sky grid in degrees.
+        times : list of datetime
+            Times to evaluate the constraint at.
+
+        Returns
+        -------
+        array
+            Boolean mask with shape (n_times, n_points).
+        """
+        # Batch evaluation with datetime array
+        result = constraint_func.in_constraint_batch(
+            ephemeris=self.ditl.ephem,
+            target_ras=target_ras,
+            target_decs=target_decs,
+            times=times,  # Pass entire array of datetime objects
+        )
+        # Result shape is (n_points, n_times) from rust_ephem; store it
+        # transposed so each frame reads one contiguous row
+        return np.ascontiguousarray(np.asarray(result, dtype=bool).T)
+
     def _plot_constraint_regions(self, utime: float) -> None:
         """Plot constraint regions for Sun, Moon, and Earth.
 
@@ -658,18 +702,22 @@ class SkyPointingController:
         else:
             ra_flat, dec_flat = self._create_sky_grid(self.n_grid_points)
 
-        # Vectorized calculation of angular distances from Earth center
-        delta_ra = np.radians(ra_flat - earth_ra)
+        # Vectorized cosine of the angular distance from Earth center, built
+        # in place to avoid allocating a temporary per term
         dec_rad = np.radians(dec_flat)
         earth_dec_rad = np.radians(earth_dec)
 
-        cos_value = np.sin(earth_dec_rad) * np.sin(dec_rad) + np.cos(
-            earth_dec_rad
-        ) * np.cos(dec_rad) * np.cos(delta_ra)
-        angular_dist = np.degrees(np.arccos(np.clip(cos_value, -1.0, 1.0)))
+        cos_value = np.radians(ra_flat - earth_ra)
+        np.cos(cos_value, out=cos_value)
+        cos_value *= np.cos(dec_rad)
+        cos_value *= np.cos(earth_dec_rad)
+        np.sin(dec_rad, out=dec_rad)
+        dec_rad *= np.sin(earth_dec_rad)
+        cos_value += dec_rad
 
-        # Find points inside the Earth disk
-        inside_earth = angular_dist <= earth_angular_radius
+        # Find points inside the Earth disk: comparing against the cosine of
+        # the radius avoids arccos/degrees/clip passes over the whole grid
+        inside_earth = cos_value >= np.cos(np.radians(earth_angular_radius))
 
         # Plot Earth disk points
         if inside_earth.any():
@@ -813,13 +861,8 @@ class SkyPointingController:
         ):
             cache = self._constraint_cache
 
-            # Verify cache consistency
-            current_ra_flat, current_dec_flat = self._create_sky_grid(
-                self.n_grid_points
-            )
-            if len(cache["ra_grid"]) == len(current_ra_flat) and len(
-                cache["dec_grid"]
-            ) == len(current_dec_flat):
+            # Verify cache consistency without regenerating the grid
+            if self._grid_signature == (self.n_grid_points, len(cache["ra_grid"])):
                 # Use pre-computed constraints
                 ra_flat = cache["ra_grid"]
                 dec_flat = cache["dec_grid"]
@@ -829,12 +872,12 @@ class SkyPointingController:
                 cache_time_idx = np.where(cache["time_indices"] == time_idx)[0]
                 if (
                     len(cache_time_idx) > 0
-                    and cache_time_idx[0] < cache["constraints"][name.lower()].shape[1]
+                    and cache_time_idx[0] < cache["constraints"][name.lower()].shape[0]
                 ):
                     cache_time_idx = cache_time_idx[0]
-                    # Cache shape is (n_points, n_times), so index with [:, time_idx]
+                    # Cache shape is (n_times, n_points), so index with [time_idx, :]
                     constrained_coords = cache["constraints"][name.lower()][
-                        :, cache_time_idx
+                        cache_time_idx, :
                     ]
 
                     # Ensure constrained_coords is a boolean array
@@ -842,16 +885,9 @@ class SkyPointingController:
 
                     # Plot constrained region
                     if constrained_coords.any():
-                        points = np.column_stack(
-                            (ra_flat[constrained_coords], dec_flat[constrained_coords])
-                        )
-
-                        ra_vals = points[:, 0]
-                        dec_vals = points[:, 1]
-
                         self._plot_points_on_sky(
-                            ra_vals,
-                            dec_vals,
+                            ra_flat[constrained_coords],
+                            dec_flat[constrained_coords],
                             color,
                             alpha=self.constraint_alpha,
                             label=f"{name} Cons.",
@@ -887,16 +923,9 @@ class SkyPointingController:
 
         # Plot constrained region
         if constrained_coords.any():
-            points = np.column_stack(
-                (ra_flat[constrained_coords], dec_flat[constrained_coords])
-            )
-
-            ra_vals = points[:, 0]
-            dec_vals = points[:, 1]
-
             self._plot_points_on_sky(
-                ra_vals,
-                dec_vals,
+                ra_flat[constrained_coords],
+                dec_flat[constrained_coords],
                 color,
                 alpha=self.constraint_alpha,
                 label=f"{name} Cons.",
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from conops import ACS, AttitudeControlSystem, Constraint, SpacecraftBus
+from conops import ACS, AttitudeControlSystem, Constraint, Slew, SpacecraftBus
 
 
 class DummyEphemeris:
@@ -66,18 +66,36 @@ def mock_config(mock_ephem, mock_constraint):
     return config
 
 
+@pytest.fixture(scope="module")
+def _patched_passtimes():
+    """Patch PassTimes where ACS looks it up, once per test module."""
+    with patch("conops.simulation.acs.PassTimes") as mock_passtimes:
+        yield mock_passtimes
+
+
 @pytest.fixture
-def acs(mock_constraint, mock_config):
+def acs(mock_constraint, mock_config, _patched_passtimes):
     """Create an ACS instance with mocked dependencies."""
-    with patch("conops.simulation.passes.PassTimes") as mock_passtimes:
-        mock_pt = Mock()
-        mock_pt.passes = []
-        mock_pt.next_pass = Mock(return_value=None)
-        mock_pt.__iter__ = Mock(return_value=iter([]))
-        mock_passtimes.return_value = mock_pt
-        acs_instance = ACS(config=mock_config)
-        acs_instance.passrequests = mock_pt
-        return acs_instance
+    mock_pt = Mock()
+    mock_pt.passes = []
+    mock_pt.next_pass = Mock(return_value=None)
+    mock_pt.__iter__ = Mock(return_value=iter([]))
+    _patched_passtimes.return_value = mock_pt
+    acs_instance = ACS(config=mock_config)
+    acs_instance.passrequests = mock_pt
+    return acs_instance
+
+
+@pytest.fixture
+def slew_mock_factory(spec_mock):
+    """Return a callable producing fresh Mock(spec=Slew) copies."""
+    return lambda: spec_mock(Slew)
+
+
+@pytest.fixture
+def slew_mock(slew_mock_factory):
+    """Create a Mock(spec=Slew) copied from a cached prototype."""
+    return slew_mock_factory()
 
 
 @pytest.fixture
@@ -85,13 +103,13 @@ def bus():
     return SpacecraftBus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def acs_config():
     return AttitudeControlSystem(
         slew_acceleration=1.0, max_slew_rate=0.5, settle_time=90.0
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_acs():
     return AttitudeControlSystem()
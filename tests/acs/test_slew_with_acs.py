@@ -1,4 +1,4 @@
-from conops import AttitudeControlSystem, Constraint, MissionConfig, Slew, SpacecraftBus
+from conops import Constraint, MissionConfig, Slew, SpacecraftBus
 
 
 class DummyConstraint(Constraint):
@@ -9,33 +9,28 @@ class DummyConstraint(Constraint):
         self.ephem = object()
 
 
-def test_slew_uses_acs_config():
-    acs = AttitudeControlSystem(
-        slew_acceleration=1.0, max_slew_rate=0.5, settle_time=90.0
-    )
-    constraint = DummyConstraint()
-    spacecraft_bus = SpacecraftBus(attitude_control=acs)
+def _make_slew(acs):
     config = MissionConfig(
-        name="Test", constraint=constraint, spacecraft_bus=spacecraft_bus
+        name="Test",
+        constraint=DummyConstraint(),
+        spacecraft_bus=SpacecraftBus(attitude_control=acs),
     )
-    s = Slew(config=config)
+    return Slew(config=config)
+
+
+def test_slew_uses_acs_config(acs_config):
+    s = _make_slew(acs_config)
     s.startra = 0
     s.startdec = 0
     s.endra = 90
     s.enddec = 0
-    expected = acs.slew_time(90.0)
+    expected = acs_config.slew_time(90.0)
     calc = s.calc_slewtime()
     assert calc == round(expected)
 
 
-def test_slew_path_and_secs_lengths():
-    acs = AttitudeControlSystem()
-    constraint = DummyConstraint()
-    spacecraft_bus = SpacecraftBus(attitude_control=acs)
-    config = MissionConfig(
-        name="Test", constraint=constraint, spacecraft_bus=spacecraft_bus
-    )
-    s = Slew(config=config)
+def test_slew_path_and_secs_lengths(default_acs):
+    s = _make_slew(default_acs)
     s.startra = 10
     s.startdec = 5
     s.endra = 20
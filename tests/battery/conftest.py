@@ -1,6 +1,7 @@
 """Test fixtures for battery subsystem tests."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import numpy as np
 import pytest
@@ -8,6 +9,7 @@ import pytest
 from conops import (
     Battery,
     Constraint,
+    DITLMixin,
     EmergencyCharging,
     MissionConfig,
     QueueDITL,
@@ -22,56 +24,46 @@ from conops.config import (
 )
 
 
+# Batteries are built once per session and handed out as copies, since tests
+# drain and charge them. All Battery fields are scalars, so a shallow
+# model_copy() gives each test independent state.
+@pytest.fixture(scope="session")
+def _battery_templates():
+    return {
+        "default": Battery(),
+        "custom_threshold": Battery(recharge_threshold=0.90),
+        # Allows discharge to 65% charge level
+        "dod": Battery(max_depth_of_discharge=0.35),
+        "dod_and_threshold": Battery(
+            max_depth_of_discharge=0.35, recharge_threshold=0.95
+        ),
+        "20wh": Battery(amphour=2, voltage=10, watthour=20),
+        "1wh": Battery(amphour=1, voltage=1, watthour=1),
+    }
+
+
 @pytest.fixture
-def default_battery():
+def default_battery(_battery_templates):
     """Fixture for a default Battery instance."""
-    return Battery()
+    return _battery_templates["default"].model_copy()
 
 
 @pytest.fixture
-def battery_with_custom_threshold():
+def battery_with_custom_threshold(_battery_templates):
     """Fixture for a Battery instance with custom recharge threshold."""
-    return Battery(recharge_threshold=0.90)
+    return _battery_templates["custom_threshold"].model_copy()
 
 
 @pytest.fixture
-def battery_with_dod():
+def battery_with_dod(_battery_templates):
     """Fixture for a Battery instance with max depth of discharge."""
-    return Battery(max_depth_of_discharge=0.35)  # Allows discharge to 65% charge level
+    return _battery_templates["dod"].model_copy()
 
 
 @pytest.fixture
-def battery_with_dod_and_threshold():
+def battery_with_dod_and_threshold(_battery_templates):
     """Fixture for a Battery instance with both max depth of discharge and recharge threshold."""
-    return Battery(max_depth_of_discharge=0.35, recharge_threshold=0.95)
-
-
-@pytest.fixture
-def mock_constraint():
-    """Create a mock constraint."""
-    constraint = Mock(spec=Constraint)
-    constraint.in_constraint = Mock(return_value=False)
-    constraint.ephem = Mock()  # Add ephem for Pointing initialization
-    # Add panel_constraint with solar_panel for EmergencyCharging initialization
-    constraint.panel_constraint = Mock()
-    constraint.panel_constraint.solar_panel = Mock(spec=SolarPanel)
-    constraint.in_eclipse = Mock(return_value=False)
-    return constraint
-
-
-@pytest.fixture
-def mock_solar_panel():
-    """Create a mock solar panel."""
-    solar_panel = Mock(spec=SolarPanelSet)
-    solar_panel.optimal_charging_pointing = Mock(return_value=(180.0, 0.0))
-    solar_panel.panel_illumination_fraction = Mock(return_value=0.8)
-    return solar_panel
-
-
-@pytest.fixture
-def mock_acs_config():
-    """Create a mock ACS config."""
-    return Mock()
+    return _battery_templates["dod_and_threshold"].model_copy()
 
 
 @pytest.fixture
@@ -84,7 +76,7 @@ def emergency_charging(mock_config):
 
 
 @pytest.fixture
-def mock_config(mock_ephem):
+def mock_config(mock_ephem, spec_mock):
     """Create a mock config with required components."""
     # Create minimal required components
     spacecraft_bus = SpacecraftBus(
@@ -97,10 +89,12 @@ def mock_config(mock_ephem):
     battery = Battery(capacity_wh=1000, max_depth_of_discharge=0.8)
     solar_panel = SolarPanelSet(panels=[SolarPanel(sidemount=False)])
 
-    constraint = Mock(spec=Constraint)
-    constraint.ephem = mock_ephem
-    constraint.in_constraint = Mock(return_value=False)
-    constraint.in_eclipse = Mock(return_value=False)
+    constraint = spec_mock(
+        Constraint,
+        ephem=mock_ephem,
+        in_constraint=Mock(return_value=False),
+        in_eclipse=Mock(return_value=False),
+    )
 
     config = MissionConfig(
         spacecraft_bus=spacecraft_bus,
@@ -113,78 +107,89 @@ def mock_config(mock_ephem):
     return config
 
 
+# Read-only ephemeris values shared by every queue_ditl instance
+_INDEX_ZERO = np.array([0])
+_SUN_SEPARATION = np.array([2.0])
+_EARTH_RADIUS_ANGLE = np.array([1.0])
+for _array in (_INDEX_ZERO, _SUN_SEPARATION, _EARTH_RADIUS_ANGLE):
+    _array.setflags(write=False)
+
+
+def _stub_ditl_mixin_init(self, config=None, ephem=None, begin=None, end=None):
+    """Stand-in for DITLMixin.__init__ that sets config and calls _init_subsystems."""
+    self.config = config
+    self.ephem = ephem or Mock()  # Mock ephem
+    self._init_subsystems()
+
+
+@pytest.fixture
+def stub_ditl_mixin_init(monkeypatch):
+    """Replace DITLMixin.__init__ so QueueDITL can be built without an ephemeris."""
+    monkeypatch.setattr(DITLMixin, "__init__", _stub_ditl_mixin_init)
+
+
 @pytest.fixture
-def queue_ditl(mock_config):
+def queue_ditl(mock_config, stub_ditl_mixin_init, spec_mock):
     """Create a QueueDITL instance with mocked dependencies."""
+    ditl = QueueDITL(config=mock_config)
+
+    # Mock ephemeris
+    ditl.ephem = Mock()
+    ditl.ephem.index.return_value = _INDEX_ZERO
+
+    # Mock sun and earth for eclipse check
+    mock_sun = Mock()
+    mock_earth = SimpleNamespace()
+    mock_sun.separation.return_value = _SUN_SEPARATION  # Not in eclipse
+
+    # Create mock list-like objects for sun and earth
+    sun_list = Mock()
+    sun_list.__getitem__ = Mock(return_value=mock_sun)
+    earth_list = Mock()
+    earth_list.__getitem__ = Mock(return_value=mock_earth)
 
-    def mock_ditl_init(self, config=None, ephem=None, begin=None, end=None):
-        """Mock DITLMixin.__init__ that sets config and calls _init_subsystems."""
-        self.config = config
-        self.ephem = ephem or Mock()  # Mock ephem
-        self._init_subsystems()
-
-    with patch(
-        "conops.DITLMixin.__init__",
-        side_effect=mock_ditl_init,
-        autospec=False,
-    ):
-        ditl = QueueDITL(config=mock_config)
-
-        # Mock ephemeris
-        ditl.ephem = Mock()
-        ditl.ephem.index.return_value = np.array([0])
-
-        # Mock sun and earth for eclipse check
-        mock_sun = Mock()
-        mock_earth = Mock()
-        mock_sun.separation.return_value = np.array([2.0])  # Not in eclipse
-
-        # Create mock list-like objects for sun and earth
-        sun_list = Mock()
-        sun_list.__getitem__ = Mock(return_value=mock_sun)
-        earth_list = Mock()
-        earth_list.__getitem__ = Mock(return_value=mock_earth)
-
-        ditl.ephem.sun = sun_list
-        ditl.ephem.earth = earth_list
-        ditl.ephem.earth_radius_angle = np.array([1.0])
-
-        # Mock ACS
-        ditl.acs = Mock()
-        ditl.acs.solar_panel = Mock()
-        ditl.acs.solar_panel.optimal_charging_pointing = Mock(return_value=(180.0, 0.0))
-
-        # Initialize the tracking variables (already done in __init__ but ensure they exist)
-        if not hasattr(ditl, "charging_ppt"):
-            ditl.charging_ppt = None
-        if not hasattr(ditl, "emergency_charging"):
-            ditl.emergency_charging = Mock(spec=EmergencyCharging)
-            ditl.emergency_charging.next_charging_obsid = 999000
-
-        return ditl
+    ditl.ephem.sun = sun_list
+    ditl.ephem.earth = earth_list
+    ditl.ephem.earth_radius_angle = _EARTH_RADIUS_ANGLE
+
+    # Mock ACS
+    ditl.acs = Mock()
+    ditl.acs.solar_panel = Mock()
+    ditl.acs.solar_panel.optimal_charging_pointing = Mock(return_value=(180.0, 0.0))
+
+    # Initialize the tracking variables (already done in __init__ but ensure they exist)
+    if not hasattr(ditl, "charging_ppt"):
+        ditl.charging_ppt = None
+    if not hasattr(ditl, "emergency_charging"):
+        ditl.emergency_charging = spec_mock(
+            EmergencyCharging, next_charging_obsid=999000
+        )
+
+    return ditl
 
 
 @pytest.fixture
-def mock_battery():
+def mock_battery(spec_mock):
     """Create a mock battery."""
-    battery = Mock(spec=Battery)
-    battery.battery_alert = False
-    battery.battery_level = 0.80
-    battery.drain = Mock()
-    battery.charge = Mock()
-    return battery
+    return spec_mock(
+        Battery,
+        battery_alert=False,
+        battery_level=0.80,
+        drain=Mock(),
+        charge=Mock(),
+    )
 
 
 @pytest.fixture
-def batt_20wh():
+def batt_20wh(_battery_templates):
     """Create a battery with 20 watthours capacity."""
-    return Battery(amphour=2, voltage=10, watthour=20)
+    return _battery_templates["20wh"].model_copy()
 
 
 @pytest.fixture
-def batt_1wh():
+def batt_1wh(_battery_templates):
     """Create a battery with 1 watthour capacity."""
-    return Battery(amphour=1, voltage=1, watthour=1)
+    return _battery_templates["1wh"].model_copy()
 
 
 # Common fixtures pulled out for reuse across many tests
@@ -193,16 +198,14 @@ def utime():
     return 1700000000.0
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ephem():
     """A default ephem object with sun at RA=180, Dec=0."""
-    ephem = Mock()
-    ephem.index = Mock(return_value=0)
-    sun_coord = Mock()
-    sun_coord.ra = Mock()
-    sun_coord.dec = Mock()
-    sun_coord.ra.deg = 180.0
-    sun_coord.dec.deg = 0.0
-    ephem.sun = [sun_coord]
-    ephem.in_eclipse = Mock(return_value=False)
-    return ephem
+    sun_coord = SimpleNamespace(
+        ra=SimpleNamespace(deg=180.0), dec=SimpleNamespace(deg=0.0)
+    )
+    return SimpleNamespace(
+        index=lambda *args, **kwargs: 0,
+        sun=[sun_coord],
+        in_eclipse=lambda *args, **kwargs: False,
+    )
@@ -1,13 +1,13 @@
 """Unit tests for emergency battery recharge functionality."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import numpy as np
 import pytest
 
 from conops import (
     ACSMode,
-    Battery,
     EmergencyCharging,
     Pointing,
     QueueDITL,
@@ -17,6 +17,46 @@ from conops import (
 )
 
 
+def _always_true(*args, **kwargs):
+    return True
+
+
+def _always_false(*args, **kwargs):
+    return False
+
+
+def _constrained_up_to_ra_180(ra, dec, utime, hardonly=True):
+    return ra <= 180.0
+
+
+def _sun_ephem(sun_ra, sun_dec):
+    """Ephemeris stand-in with a single Sun position."""
+    sun_coord = SimpleNamespace(
+        ra=SimpleNamespace(deg=sun_ra), dec=SimpleNamespace(deg=sun_dec)
+    )
+    return SimpleNamespace(index=lambda *args, **kwargs: 0, sun=[sun_coord])
+
+
+def _radec_key(ra, dec):
+    """Lookup key for an RA/Dec pair, rounded to absorb float noise."""
+    return round(ra, 6), round(dec, 6)
+
+
+# (charge fraction, expected alert) for a battery with 35% max DoD and a 95%
+# recharge threshold: discharging into alert, then recharging out of it
+RECHARGE_CASES = [
+    (0.60, True),
+    (0.80, True),
+    (0.94, True),
+    (0.95, False),
+    (1.0, False),
+    (0.55, True),
+]
+# The same cases as absolute charge levels for the default 560 Wh battery
+_fractions, _alerts = zip(*RECHARGE_CASES)
+RECHARGE_LEVELS = list(zip((np.array(_fractions) * 560.0).tolist(), _alerts))
+
+
 class TestBattery:
     """Test Battery class emergency recharge functionality."""
 
@@ -155,12 +195,7 @@ class TestSolarPanel:
     def test_optimal_charging_ra_sidemount(self):
         """Test RA for side-mounted panels."""
         panel = SolarPanelSet(panels=[SolarPanel(sidemount=True)])
-        mock_ephem = Mock()
-        mock_ephem.index.return_value = 0
-        mock_sun_coord = Mock()
-        mock_sun_coord.ra.deg = 45.0
-        mock_sun_coord.dec.deg = 10.0
-        mock_ephem.sun = [mock_sun_coord]
+        mock_ephem = _sun_ephem(45.0, 10.0)
         utime = 1700000000.0
         ra, dec = panel.optimal_charging_pointing(utime, mock_ephem)
         assert ra == (45.0 + 90.0) % 360.0
@@ -168,12 +203,7 @@ class TestSolarPanel:
     def test_optimal_charging_dec_sidemount(self):
         """Test Dec for side-mounted panels."""
         panel = SolarPanelSet(panels=[SolarPanel(sidemount=True)])
-        mock_ephem = Mock()
-        mock_ephem.index.return_value = 0
-        mock_sun_coord = Mock()
-        mock_sun_coord.ra.deg = 45.0
-        mock_sun_coord.dec.deg = 10.0
-        mock_ephem.sun = [mock_sun_coord]
+        mock_ephem = _sun_ephem(45.0, 10.0)
         utime = 1700000000.0
         ra, dec = panel.optimal_charging_pointing(utime, mock_ephem)
         assert dec == 10.0
@@ -181,12 +211,7 @@ class TestSolarPanel:
     def test_optimal_charging_ra_bodymount(self):
         """Test RA for body-mounted panels."""
         panel = SolarPanelSet(panels=[SolarPanel(sidemount=False)])
-        mock_ephem = Mock()
-        mock_ephem.index.return_value = 0
-        mock_sun_coord = Mock()
-        mock_sun_coord.ra.deg = 120.0
-        mock_sun_coord.dec.deg = -15.0
-        mock_ephem.sun = [mock_sun_coord]
+        mock_ephem = _sun_ephem(120.0, -15.0)
         utime = 1700000000.0
         ra, dec = panel.optimal_charging_pointing(utime, mock_ephem)
         assert ra == 120.0
@@ -194,12 +219,7 @@ class TestSolarPanel:
     def test_optimal_charging_dec_bodymount(self):
         """Test Dec for body-mounted panels."""
         panel = SolarPanelSet(panels=[SolarPanel(sidemount=False)])
-        mock_ephem = Mock()
-        mock_ephem.index.return_value = 0
-        mock_sun_coord = Mock()
-        mock_sun_coord.ra.deg = 120.0
-        mock_sun_coord.dec.deg = -15.0
-        mock_ephem.sun = [mock_sun_coord]
+        mock_ephem = _sun_ephem(120.0, -15.0)
         utime = 1700000000.0
         ra, dec = panel.optimal_charging_pointing(utime, mock_ephem)
         assert dec == -15.0
@@ -207,12 +227,7 @@ class TestSolarPanel:
     def test_optimal_charging_pointing_wraps_ra(self):
         """Test that RA wraps correctly at 360 degrees."""
         panel = SolarPanelSet(panels=[SolarPanel(sidemount=True)])
-        mock_ephem = Mock()
-        mock_ephem.index.return_value = 0
-        mock_sun_coord = Mock()
-        mock_sun_coord.ra.deg = 350.0
-        mock_sun_coord.dec.deg = 0.0
-        mock_ephem.sun = [mock_sun_coord]
+        mock_ephem = _sun_ephem(350.0, 0.0)
         utime = 1700000000.0
         ra, dec = panel.optimal_charging_pointing(utime, mock_ephem)
         assert ra == 80.0
@@ -254,11 +269,9 @@ class TestEmergencyCharging:
     def test_create_charging_pointing_success_returns_pointing(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_constraint", lambda ra, dec, time: False
+            emergency_charging.constraint, "in_constraint", _always_false
         )
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert ppt is not None
@@ -266,18 +279,14 @@ class TestEmergencyCharging:
     def test_create_charging_pointing_success_is_pointing_type(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert isinstance(ppt, Pointing)
 
     def test_create_charging_pointing_assigns_ra_dec_name_obsid(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert ppt.ra == 180.0
         assert ppt.dec == 0.0
@@ -287,18 +296,14 @@ class TestEmergencyCharging:
     def test_create_charging_pointing_sets_current_ppt(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert emergency_charging.current_charging_ppt == ppt
 
     def test_create_charging_pointing_increments_obsid_values(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt1 = emergency_charging.create_charging_pointing(utime, mock_ephem)
         ppt2 = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert ppt1.obsid == 999000
@@ -307,9 +312,7 @@ class TestEmergencyCharging:
     def test_create_charging_pointing_increments_next_charging_obsid(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         emergency_charging.create_charging_pointing(utime, mock_ephem)
         emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert emergency_charging.next_charging_obsid == 999002
@@ -332,19 +335,13 @@ class TestEmergencyCharging:
 
         emergency_charging.constraint.in_constraint = mock_in_constraint
 
-        def mock_illumination(time, ra, dec, ephem):
-            if ra == 210.0:
-                return 0.9
-            return 0.5
-
+        illum_by_ra = {210.0: 0.9}
         object.__setattr__(
             emergency_charging.solar_panel,
             "panel_illumination_fraction",
-            mock_illumination,
-        )
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
+            lambda time, ra, dec, ephem: illum_by_ra.get(ra, 0.5),
         )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert ppt is not None
         assert ppt.ra == 210.0
@@ -352,10 +349,8 @@ class TestEmergencyCharging:
     def test_create_charging_pointing_no_valid_pointing_returns_none_and_no_current(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        emergency_charging.constraint.in_constraint = Mock(return_value=True)
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        emergency_charging.constraint.in_constraint = _always_true
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         ppt = emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert ppt is None
         assert emergency_charging.current_charging_ppt is None
@@ -363,9 +358,7 @@ class TestEmergencyCharging:
     def test_clear_current_charging_resets_current_ppt(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert emergency_charging.current_charging_ppt is not None
         emergency_charging.clear_current_charging()
@@ -377,256 +370,43 @@ class TestEmergencyCharging:
     def test_is_charging_active_true_after_create(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         emergency_charging.create_charging_pointing(utime, mock_ephem)
         assert emergency_charging.is_charging_active() is True
 
     def test_is_charging_active_false_after_clear(
         self, emergency_charging, mock_ephem, monkeypatch, utime
     ):
-        monkeypatch.setattr(
-            emergency_charging.constraint, "in_eclipse", lambda ra, dec, time: False
-        )
+        monkeypatch.setattr(emergency_charging.constraint, "in_eclipse", _always_false)
         emergency_charging.create_charging_pointing(utime, mock_ephem)
         emergency_charging.clear_current_charging()
         assert emergency_charging.is_charging_active() is False
 
-    def _helper_find_valid_pointing_sidemount(
-        self,
-        emergency_charging,
-        sun_ra,
-        sun_dec,
-        utime,
-        current_ra=None,
-        current_dec=None,
-    ):
-        # Utility: returns found pointing
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime, current_ra, current_dec
-        )
-        return ra, dec
-
-    def test_find_valid_pointing_sidemount_success_ra_not_none(
-        self, emergency_charging
-    ):
-        sun_ra = 180.0
-        sun_dec = 0.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
-        ra, dec = self._helper_find_valid_pointing_sidemount(
-            emergency_charging, sun_ra, sun_dec, utime
-        )
-        assert ra is not None
-
-    def test_find_valid_pointing_sidemount_success_dec_not_none(
-        self, emergency_charging
-    ):
-        sun_ra = 180.0
-        sun_dec = 0.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
-        ra, dec = self._helper_find_valid_pointing_sidemount(
-            emergency_charging, sun_ra, sun_dec, utime
-        )
-        assert dec is not None
-
-    def test_find_valid_pointing_sidemount_success_is_approximately_90deg(
-        self, emergency_charging
-    ):
-        sun_ra = 180.0
-        sun_dec = 0.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
-        ra, dec = self._helper_find_valid_pointing_sidemount(
-            emergency_charging, sun_ra, sun_dec, utime
-        )
-        ra_rad = np.radians(ra)
-        dec_rad = np.radians(dec)
-        sun_ra_rad = np.radians(sun_ra)
-        sun_dec_rad = np.radians(sun_dec)
-        pointing_vec = np.array(
-            [
-                np.cos(dec_rad) * np.cos(ra_rad),
-                np.cos(dec_rad) * np.sin(ra_rad),
-                np.sin(dec_rad),
-            ]
-        )
-        sun_vec = np.array(
-            [
-                np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                np.sin(sun_dec_rad),
-            ]
-        )
-        dot_product = np.dot(pointing_vec, sun_vec)
-        sep_angle = np.degrees(np.arccos(np.clip(dot_product, -1, 1)))
-        assert abs(sep_angle - 90.0) < 1.5
-
-    def test_find_valid_pointing_sidemount_constraint_violation_ra_not_none(
-        self, emergency_charging
-    ):
-        sun_ra = 90.0
-        sun_dec = 45.0
-        utime = 1700000000.0
-
-        def mock_in_constraint(ra, dec, utime, hardonly=True):
-            return ra <= 180.0
-
-        emergency_charging.constraint.in_constraint = mock_in_constraint
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        assert ra is not None
-
-    def test_find_valid_pointing_sidemount_constraint_violation_dec_not_none(
-        self, emergency_charging
-    ):
-        sun_ra = 90.0
-        sun_dec = 45.0
-        utime = 1700000000.0
-
-        def mock_in_constraint(ra, dec, utime, hardonly=True):
-            return ra <= 180.0
-
-        emergency_charging.constraint.in_constraint = mock_in_constraint
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        assert dec is not None
-
-    def test_find_valid_pointing_sidemount_constraint_violation_ra_greater_180(
-        self, emergency_charging
-    ):
-        sun_ra = 90.0
-        sun_dec = 45.0
-        utime = 1700000000.0
-
-        def mock_in_constraint(ra, dec, utime, hardonly=True):
-            return ra <= 180.0
-
-        emergency_charging.constraint.in_constraint = mock_in_constraint
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        assert ra > 180.0
-
-    def test_find_valid_pointing_sidemount_constraint_violation_still_90deg(
-        self, emergency_charging
-    ):
-        sun_ra = 90.0
-        sun_dec = 45.0
-        utime = 1700000000.0
-
-        def mock_in_constraint(ra, dec, utime, hardonly=True):
-            return ra <= 180.0
-
-        emergency_charging.constraint.in_constraint = mock_in_constraint
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        ra_rad = np.radians(ra)
-        dec_rad = np.radians(dec)
-        sun_ra_rad = np.radians(sun_ra)
-        sun_dec_rad = np.radians(sun_dec)
-        pointing_vec = np.array(
-            [
-                np.cos(dec_rad) * np.cos(ra_rad),
-                np.cos(dec_rad) * np.sin(ra_rad),
-                np.sin(dec_rad),
-            ]
-        )
-        sun_vec = np.array(
-            [
-                np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                np.sin(sun_dec_rad),
-            ]
-        )
-        dot_product = np.dot(pointing_vec, sun_vec)
-        sep_angle = np.degrees(np.arccos(np.clip(dot_product, -1, 1)))
-        assert abs(sep_angle - 90.0) < 1.5
-
-    def test_find_valid_pointing_sidemount_all_constrained_ra_none(
-        self, emergency_charging
-    ):
-        sun_ra = 0.0
-        sun_dec = 0.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=True)
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        assert ra is None
-
-    def test_find_valid_pointing_sidemount_all_constrained_dec_none(
-        self, emergency_charging
-    ):
-        sun_ra = 0.0
-        sun_dec = 0.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=True)
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        assert dec is None
-
-    def test_find_valid_pointing_sidemount_sun_near_pole_ra_not_none(
-        self, emergency_charging
+    @pytest.mark.parametrize(
+        "sun_ra,sun_dec,in_constraint,expects_none",
+        [
+            (180.0, 0.0, _always_false, False),
+            (90.0, 45.0, _constrained_up_to_ra_180, False),
+            (0.0, 0.0, _always_true, True),
+            (0.0, 85.0, _always_false, False),
+        ],
+        ids=["success", "constraint_violation", "all_constrained", "sun_near_pole"],
+    )
+    def test_find_valid_pointing_sidemount(
+        self, emergency_charging, sun_ra, sun_dec, in_constraint, expects_none
     ):
-        sun_ra = 0.0
-        sun_dec = 85.0
         utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
+        emergency_charging.constraint.in_constraint = in_constraint
         ra, dec = emergency_charging._find_valid_pointing_sidemount(
             sun_ra, sun_dec, utime
         )
+        if expects_none:
+            assert (ra, dec) == (None, None)
+            return
         assert ra is not None
-
-    def test_find_valid_pointing_sidemount_sun_near_pole_dec_not_none(
-        self, emergency_charging
-    ):
-        sun_ra = 0.0
-        sun_dec = 85.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
         assert dec is not None
-
-    def test_find_valid_pointing_sidemount_sun_near_pole_separated_by_90deg(
-        self, emergency_charging
-    ):
-        sun_ra = 0.0
-        sun_dec = 85.0
-        utime = 1700000000.0
-        emergency_charging.constraint.in_constraint = Mock(return_value=False)
-        ra, dec = emergency_charging._find_valid_pointing_sidemount(
-            sun_ra, sun_dec, utime
-        )
-        ra_rad = np.radians(ra)
-        dec_rad = np.radians(dec)
-        sun_ra_rad = np.radians(sun_ra)
-        sun_dec_rad = np.radians(sun_dec)
-        pointing_vec = np.array(
-            [
-                np.cos(dec_rad) * np.cos(ra_rad),
-                np.cos(dec_rad) * np.sin(ra_rad),
-                np.sin(dec_rad),
-            ]
-        )
-        sun_vec = np.array(
-            [
-                np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                np.sin(sun_dec_rad),
-            ]
-        )
-        dot_product = np.dot(pointing_vec, sun_vec)
-        sep_angle = np.degrees(np.arccos(np.clip(dot_product, -1, 1)))
-        assert abs(sep_angle - 90.0) < 1.5
+        assert not in_constraint(ra, dec, utime)
+        assert abs(angular_separation(ra, dec, sun_ra, sun_dec) - 90.0) < 1.5
 
     def test_slew_limit_constraint_returns_ppt_and_within_slew(
         self,
@@ -644,7 +424,7 @@ class TestEmergencyCharging:
             "optimal_charging_pointing",
             Mock(return_value=(100.0, 0.0)),
         )
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
 
         def mock_illumination(time, ra, dec, ephem):
             if abs(ra) < 60 or ra > 300:
@@ -654,7 +434,7 @@ class TestEmergencyCharging:
         object.__setattr__(
             mock_config.solar_panel, "panel_illumination_fraction", mock_illumination
         )
-        monkeypatch.setattr(ec.constraint, "in_eclipse", lambda ra, dec, time: False)
+        monkeypatch.setattr(ec.constraint, "in_eclipse", _always_false)
         utime = 1700000000.0
         ppt = ec.create_charging_pointing(utime, mock_ephem, lastra=0.0, lastdec=0.0)
         assert ppt is not None
@@ -694,70 +474,19 @@ class TestEmergencyCharging:
         )
         slew = angular_separation(current_ra, current_dec, ra, dec)
         assert slew <= 45.0
-        ra_rad = np.radians(ra)
-        dec_rad = np.radians(dec)
-        sun_ra_rad = np.radians(sun_ra)
-        sun_dec_rad = np.radians(sun_dec)
-        pointing_vec = np.array(
-            [
-                np.cos(dec_rad) * np.cos(ra_rad),
-                np.cos(dec_rad) * np.sin(ra_rad),
-                np.sin(dec_rad),
-            ]
-        )
-        sun_vec = np.array(
-            [
-                np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                np.sin(sun_dec_rad),
-            ]
-        )
-        dot_product = np.dot(pointing_vec, sun_vec)
-        sep_angle = np.degrees(np.arccos(np.clip(dot_product, -1, 1)))
+        sep_angle = angular_separation(ra, dec, sun_ra, sun_dec)
         assert abs(sep_angle - 90.0) < 1.5
 
-    @pytest.mark.parametrize(
-        "sun_ra,sun_dec",
-        [
-            (0.0, 0.0),
-            (90.0, 0.0),
-            (180.0, 30.0),
-            (270.0, -30.0),
-            (45.0, 60.0),
-            (300.0, -60.0),
-        ],
-    )
-    def test_sidemount_pointing_has_full_illumination_ra_dec_not_none(
+    def test_sidemount_pointing_has_full_illumination_for_sun_positions(
         self,
-        sun_ra,
-        sun_dec,
         mock_config,
     ):
         utime = 1700000000.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
 
+        # Reads the sun_ra/sun_dec loop variables below at call time
         def mock_illumination(time, ra, dec, ephem):
-            ra_rad = np.radians(ra)
-            dec_rad = np.radians(dec)
-            sun_ra_rad = np.radians(sun_ra)
-            sun_dec_rad = np.radians(sun_dec)
-            pointing_vec = np.array(
-                [
-                    np.cos(dec_rad) * np.cos(ra_rad),
-                    np.cos(dec_rad) * np.sin(ra_rad),
-                    np.sin(dec_rad),
-                ]
-            )
-            sun_vec = np.array(
-                [
-                    np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                    np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                    np.sin(sun_dec_rad),
-                ]
-            )
-            sep = np.degrees(
-                np.arccos(np.clip(np.dot(pointing_vec, sun_vec), -1.0, 1.0))
-            )
+            sep = angular_separation(ra, dec, sun_ra, sun_dec)
             if abs(sep - 90.0) < 1.5:
                 return 1.0
             return 0.5
@@ -769,9 +498,20 @@ class TestEmergencyCharging:
             config=mock_config,
             starting_obsid=999000,
         )
-        ra, dec = ec._find_valid_pointing_sidemount(sun_ra, sun_dec, utime)
-        assert ra is not None
-        assert dec is not None
+        for sun_ra, sun_dec in [
+            (0.0, 0.0),
+            (90.0, 0.0),
+            (180.0, 30.0),
+            (270.0, -30.0),
+            (45.0, 60.0),
+            (300.0, -60.0),
+        ]:
+            ra, dec = ec._find_valid_pointing_sidemount(sun_ra, sun_dec, utime)
+            assert ra is not None, (sun_ra, sun_dec)
+            assert dec is not None, (sun_ra, sun_dec)
+            # Full illumination means the pointing sits 90 deg from the Sun
+            sep = angular_separation(ra, dec, sun_ra, sun_dec)
+            assert abs(sep - 90.0) < 1.5, (sun_ra, sun_dec)
 
     def test_sidemount_pointing_has_full_illumination_value_is_one(
         self,
@@ -781,30 +521,10 @@ class TestEmergencyCharging:
         sun_ra = 90.0
         sun_dec = 0.0
         utime = 1700000000.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
 
         def mock_illumination(time, ra, dec, ephem):
-            ra_rad = np.radians(ra)
-            dec_rad = np.radians(dec)
-            sun_ra_rad = np.radians(sun_ra)
-            sun_dec_rad = np.radians(sun_dec)
-            pointing_vec = np.array(
-                [
-                    np.cos(dec_rad) * np.cos(ra_rad),
-                    np.cos(dec_rad) * np.sin(ra_rad),
-                    np.sin(dec_rad),
-                ]
-            )
-            sun_vec = np.array(
-                [
-                    np.cos(sun_dec_rad) * np.cos(sun_ra_rad),
-                    np.cos(sun_dec_rad) * np.sin(sun_ra_rad),
-                    np.sin(sun_dec_rad),
-                ]
-            )
-            sep = np.degrees(
-                np.arccos(np.clip(np.dot(pointing_vec, sun_vec), -1.0, 1.0))
-            )
+            sep = angular_separation(ra, dec, sun_ra, sun_dec)
             if abs(sep - 90.0) < 1.5:
                 return 1.0
             return 0.5
@@ -841,15 +561,14 @@ class TestEmergencyCharging:
         high_ra = (optimal_ra + 90.0) % 360.0
         high_dec = optimal_dec
 
-        def mock_illumination(time, ra, dec, ephem):
-            if abs(ra - high_ra) < 1e-6 and abs(dec - high_dec) < 1e-6:
-                return 1.0
-            if abs(ra - optimal_ra) < 1e-6 and abs(dec - optimal_dec) < 1e-6:
-                return 0.8
-            return 0.6
-
+        illum_map = {
+            _radec_key(high_ra, high_dec): 1.0,
+            _radec_key(optimal_ra, optimal_dec): 0.8,
+        }
         object.__setattr__(
-            mock_config.solar_panel, "panel_illumination_fraction", mock_illumination
+            mock_config.solar_panel,
+            "panel_illumination_fraction",
+            lambda time, ra, dec, ephem: illum_map.get(_radec_key(ra, dec), 0.6),
         )
         ec = EmergencyCharging(
             config=mock_config,
@@ -877,20 +596,18 @@ class TestEmergencyCharging:
     ):
         utime = 1700000000.0
         optimal_ra, optimal_dec = 140.0, -10.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
         object.__setattr__(
             mock_config.solar_panel,
             "optimal_charging_pointing",
             Mock(return_value=(optimal_ra, optimal_dec)),
         )
 
-        def mock_illumination(time, ra, dec, ephem):
-            if abs(ra - optimal_ra) < 1e-6 and abs(dec - optimal_dec) < 1e-6:
-                return 1.0
-            return 0.7
-
+        illum_map = {_radec_key(optimal_ra, optimal_dec): 1.0}
         object.__setattr__(
-            mock_config.solar_panel, "panel_illumination_fraction", mock_illumination
+            mock_config.solar_panel,
+            "panel_illumination_fraction",
+            lambda time, ra, dec, ephem: illum_map.get(_radec_key(ra, dec), 0.7),
         )
         ec = EmergencyCharging(
             config=mock_config,
@@ -921,7 +638,7 @@ class TestEmergencyCharging:
     ):
         utime = 1700000000.0
         optimal_ra, optimal_dec = 180.0, 0.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
         object.__setattr__(
             mock_config.solar_panel,
             "optimal_charging_pointing",
@@ -932,7 +649,7 @@ class TestEmergencyCharging:
             starting_obsid=999000,
             sidemount=True,
         )
-        monkeypatch.setattr(ec.constraint, "in_eclipse", lambda ra, dec, time: False)
+        monkeypatch.setattr(ec.constraint, "in_eclipse", _always_false)
         ppt = ec.create_charging_pointing(utime, mock_ephem)
         assert ppt is not None
 
@@ -944,7 +661,7 @@ class TestEmergencyCharging:
     ):
         utime = 1700000000.0
         optimal_ra, optimal_dec = 180.0, 0.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
         object.__setattr__(
             mock_config.solar_panel,
             "optimal_charging_pointing",
@@ -955,7 +672,7 @@ class TestEmergencyCharging:
             starting_obsid=999000,
             sidemount=True,
         )
-        monkeypatch.setattr(ec.constraint, "in_eclipse", lambda ra, dec, time: False)
+        monkeypatch.setattr(ec.constraint, "in_eclipse", _always_false)
         ppt = ec.create_charging_pointing(utime, mock_ephem)
         assert isinstance(ppt, Pointing)
 
@@ -967,7 +684,7 @@ class TestEmergencyCharging:
     ):
         utime = 1700000000.0
         optimal_ra, optimal_dec = 180.0, 0.0
-        mock_config.constraint.in_constraint = Mock(return_value=False)
+        mock_config.constraint.in_constraint = _always_false
         object.__setattr__(
             mock_config.solar_panel,
             "optimal_charging_pointing",
@@ -978,7 +695,7 @@ class TestEmergencyCharging:
             starting_obsid=999000,
             sidemount=True,
         )
-        monkeypatch.setattr(ec.constraint, "in_eclipse", lambda ra, dec, time: False)
+        monkeypatch.setattr(ec.constraint, "in_eclipse", _always_false)
         ppt = ec.create_charging_pointing(utime, mock_ephem)
         assert ppt.obsid == 999000
         assert ec.current_charging_ppt == ppt
@@ -987,57 +704,29 @@ class TestEmergencyCharging:
 class TestQueueDITLEmergencyCharging:
     """Test QueueDITL emergency charging functionality."""
 
-    def test_initialization_adds_charging_ppt_attribute(self, mock_config):
+    def test_initialization_adds_charging_ppt_attribute(
+        self, mock_config, stub_ditl_mixin_init
+    ):
         """Test that QueueDITL initializes charging-related variables."""
+        ditl = QueueDITL(config=mock_config)
+        assert hasattr(ditl, "charging_ppt")
+
+    def test_initialization_charging_ppt_is_none(
+        self, mock_config, stub_ditl_mixin_init
+    ):
+        ditl = QueueDITL(config=mock_config)
+        assert ditl.charging_ppt is None
 
-        def mock_ditl_init(self, config=None, ephem=None, begin=None, end=None):
-            self.config = config
-            self.ephem = ephem or Mock()
-            self._init_subsystems()
-
-        with patch(
-            "conops.DITLMixin.__init__",
-            side_effect=mock_ditl_init,
-            autospec=False,
-        ):
-            ditl = QueueDITL(config=mock_config)
-            assert hasattr(ditl, "charging_ppt")
-
-    def test_initialization_charging_ppt_is_none(self, mock_config):
-        def mock_ditl_init(self, config=None, ephem=None, begin=None, end=None):
-            self.config = config
-            self.ephem = ephem or Mock()
-            self._init_subsystems()
-
-        with patch(
-            "conops.DITLMixin.__init__",
-            side_effect=mock_ditl_init,
-            autospec=False,
-        ):
-            ditl = QueueDITL(config=mock_config)
-            assert ditl.charging_ppt is None
-
-    def test_initialization_emergency_charging_exists(self, mock_config):
-        def mock_ditl_init(self, config=None, ephem=None, begin=None, end=None):
-            self.config = config
-            self.ephem = ephem or Mock()
-            self._init_subsystems()
-
-        with patch(
-            "conops.DITLMixin.__init__",
-            side_effect=mock_ditl_init,
-            autospec=False,
-        ):
-            ditl = QueueDITL(config=mock_config)
-            assert hasattr(ditl, "emergency_charging")
-            assert isinstance(ditl.emergency_charging, EmergencyCharging)
+    def test_initialization_emergency_charging_exists(
+        self, mock_config, stub_ditl_mixin_init
+    ):
+        ditl = QueueDITL(config=mock_config)
+        assert hasattr(ditl, "emergency_charging")
+        assert isinstance(ditl.emergency_charging, EmergencyCharging)
 
     def test_emergency_charging_integration_returns_pointing(self, queue_ditl):
         utime = 1700000000.0
-        mock_ppt = Mock(spec=Pointing)
-        mock_ppt.ra = 180.0
-        mock_ppt.dec = 0.0
-        mock_ppt.obsid = 999000
+        mock_ppt = SimpleNamespace(ra=180.0, dec=0.0, obsid=999000)
         queue_ditl.emergency_charging.create_charging_pointing = Mock(
             return_value=mock_ppt
         )
@@ -1048,10 +737,7 @@ class TestQueueDITLEmergencyCharging:
 
     def test_emergency_charging_integration_called_once(self, queue_ditl):
         utime = 1700000000.0
-        mock_ppt = Mock(spec=Pointing)
-        mock_ppt.ra = 180.0
-        mock_ppt.dec = 0.0
-        mock_ppt.obsid = 999000
+        mock_ppt = SimpleNamespace(ra=180.0, dec=0.0, obsid=999000)
         queue_ditl.emergency_charging.create_charging_pointing = Mock(
             return_value=mock_ppt
         )
@@ -1081,12 +767,15 @@ class TestQueueDITLIntegration:
     ):
         assert ACSMode.CHARGING.value == 4
 
+    @pytest.mark.skip(reason="Placeholder; behaviour not yet exercised at runtime")
     def test_charging_ppt_terminated_on_battery_recharged(self):
         pass
 
+    @pytest.mark.skip(reason="Placeholder; behaviour not yet exercised at runtime")
     def test_charging_ppt_terminated_on_constraint_violation(self):
         pass
 
+    @pytest.mark.skip(reason="Placeholder; behaviour not yet exercised at runtime")
     def test_science_ppt_terminated_on_battery_alert(self):
         pass
 
@@ -1094,99 +783,26 @@ class TestQueueDITLIntegration:
 class TestBatteryRechargeScenarios:
     """End-to-end scenario tests for battery recharge."""
 
-    def test_full_discharge_recharge_cycle_initial_state(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        assert battery.battery_level == 1.0
-
-    def test_full_discharge_recharge_cycle_initial_alert_false(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        assert battery.battery_alert is False
-
-    def test_full_discharge_recharge_cycle_alert_after_60percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.60
-        assert battery.battery_alert is True
-
-    def test_full_discharge_recharge_cycle_emergency_recharge_after_60percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.60
-        # Access battery_alert to trigger the logic
-        _ = battery.battery_alert
-        assert battery.emergency_recharge is True
-
-    def test_full_discharge_recharge_cycle_alert_persists_at_80percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.80
-        assert battery.battery_alert is True
-
-    def test_full_discharge_recharge_cycle_emergency_recharge_persists_at_80percent(
-        self,
+    def test_full_discharge_recharge_cycle_initial_state(
+        self, battery_with_dod_and_threshold
     ):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.80
-        # Access battery_alert to trigger emergency_recharge setting
-        _ = battery.battery_alert
-        assert battery.emergency_recharge is True
-
-    def test_full_discharge_recharge_cycle_alert_persists_at_94percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.94
-        assert battery.battery_alert is True
+        battery = battery_with_dod_and_threshold
+        assert (battery.battery_level, battery.battery_alert) == (1.0, False)
 
-    def test_full_discharge_recharge_cycle_alert_clears_at_95percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.95
-        assert battery.battery_alert is False
-
-    def test_full_discharge_recharge_cycle_emergency_recharge_clears_at_95percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 0.95
-        assert battery.emergency_recharge is False
-
-    def test_full_discharge_recharge_cycle_alert_remains_cleared_at_100percent(self):
-        battery = Battery(
-            max_depth_of_discharge=0.35, recharge_threshold=0.95, watthour=560.0
-        )
-        battery.charge_level = battery.watthour * 1.0
-        assert battery.battery_alert is False
-
-    def test_multiple_charge_discharge_cycles_first_cycle_alert(self):
-        battery = Battery(max_depth_of_discharge=0.35, recharge_threshold=0.95)
-        battery.charge_level = battery.watthour * 0.60
-        assert battery.battery_alert is True
-
-    def test_multiple_charge_discharge_cycles_first_cycle_clear(self):
-        battery = Battery(max_depth_of_discharge=0.35, recharge_threshold=0.95)
-        battery.charge_level = battery.watthour * 0.95
-        assert battery.battery_alert is False
-
-    def test_multiple_charge_discharge_cycles_second_cycle_alert(self):
-        battery = Battery(max_depth_of_discharge=0.35, recharge_threshold=0.95)
-        battery.charge_level = battery.watthour * 0.55
-        assert battery.battery_alert is True
-
-    def test_multiple_charge_discharge_cycles_second_cycle_clear(self):
-        battery = Battery(max_depth_of_discharge=0.35, recharge_threshold=0.95)
-        battery.charge_level = battery.watthour * 0.95
-        assert battery.battery_alert is False
+    @pytest.mark.parametrize(
+        "charge_level,expected_alert",
+        RECHARGE_LEVELS,
+        ids=[f"{fraction:.0%}" for fraction, _ in RECHARGE_CASES],
+    )
+    def test_discharge_recharge_alert(
+        self, battery_with_dod_and_threshold, charge_level, expected_alert
+    ):
+        battery = battery_with_dod_and_threshold
+        assert battery.watthour == 560.0
+        battery.charge_level = charge_level
+        assert battery.battery_alert is expected_alert
+        # Reading battery_alert latches emergency_recharge to the same state
+        assert battery.emergency_recharge is expected_alert
 
 
 if __name__ == "__main__":
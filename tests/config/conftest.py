@@ -1,5 +1,8 @@
 """Test fixtures for config subsystem tests."""
 
+import json
+from collections import namedtuple
+
 import pytest
 
 from conops import (
@@ -13,9 +16,16 @@ from conops import (
 )
 from conops.config.recorder import OnboardRecorder
 
+MinimalConfigBundle = namedtuple(
+    "MinimalConfigBundle",
+    "config spacecraft_bus solar_panel payload battery constraint ground_stations "
+    "recorder",
+)
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_config():
+    """Shared MissionConfig and its components; tests only read from it."""
     name = "Test Config"
     spacecraft_bus = SpacecraftBus()
     solar_panel = SolarPanelSet()
@@ -36,13 +46,37 @@ def minimal_config():
         recorder=recorder,
     )
 
-    return {
-        "config": config,
-        "spacecraft_bus": spacecraft_bus,
-        "solar_panel": solar_panel,
-        "payload": payload,
-        "battery": battery,
-        "constraint": constraint,
-        "ground_stations": ground_stations,
-        "recorder": recorder,
+    return MinimalConfigBundle(
+        config=config,
+        spacecraft_bus=spacecraft_bus,
+        solar_panel=solar_panel,
+        payload=payload,
+        battery=battery,
+        constraint=constraint,
+        ground_stations=ground_stations,
+        recorder=recorder,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_config_json(tmp_path_factory):
+    """Write a sample config JSON file once; returns (file_path, expected_name)."""
+    json_data = {
+        "name": "Test Config",
+        "spacecraft_bus": {"mass": 100.0},
+        "solar_panel": {"area": 10.0},
+        "payload": {"mass": 50.0},
+        "battery": {"capacity": 200.0, "max_depth_of_discharge": 0.8},
+        "constraint": {"some_constraint": "value"},
+        "ground_stations": {},
     }
+    file_path = tmp_path_factory.mktemp("config") / "config.json"
+    with open(file_path, "w") as f:
+        json.dump(json_data, f)
+    return file_path, json_data["name"]
+
+
+@pytest.fixture(scope="module")
+def config_json_dir(tmp_path_factory):
+    """Temporary directory shared by the JSON round-trip tests in a module."""
+    return tmp_path_factory.mktemp("config_json")
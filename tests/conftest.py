@@ -1,21 +1,36 @@
 """Shared pytest fixtures for test suite."""
 
+import copy
+import functools
 from unittest.mock import Mock
 
 import pytest
 
 
-@pytest.fixture
-def mock_ephem():
-    """Create mock ephemeris."""
-    ephem = Mock()
-    ephem.step_size = 60.0
-    ephem.timestamp = Mock()
-    ephem.timestamp.unix = [1514764800.0 + i * 60.0 for i in range(1440)]
-    ephem.earth = [Mock(ra=Mock(deg=0.0), dec=Mock(deg=0.0)) for _ in range(1440)]
-    ephem.sun = [Mock(ra=Mock(deg=0.0), dec=Mock(deg=0.0))]
-    ephem.index.return_value = 0
-    return ephem
+@functools.lru_cache(maxsize=None)
+def _spec_prototype(cls):
+    """Spec'd prototype mock for cls, built once per class."""
+    return Mock(spec=cls)
+
+
+@pytest.fixture(scope="session")
+def spec_mock():
+    """Factory for independent Mock(spec=cls) instances.
+
+    Mock(spec=...) introspects the whole class on construction, so each class
+    gets one cached prototype and callers receive cheap copies of it. Keyword
+    arguments are applied to the copy with configure_mock.
+    """
+
+    def _create(cls, **attrs):
+        mock = copy.copy(_spec_prototype(cls))
+        # copy.copy shares the child-mock registry and call lists; give the copy its own
+        mock._mock_children = {}
+        mock.reset_mock()
+        mock.configure_mock(**attrs)
+        return mock
+
+    return _create
 
 
 @pytest.fixture
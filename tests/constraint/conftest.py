@@ -1,22 +1,23 @@
 """Test fixtures for constraint subsystem tests."""
 
+import contextlib
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
+import rust_ephem
 
 from conops import Constraint
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def constraint():
     """Fixture for a basic Constraint instance."""
     return Constraint()
 
 
-@pytest.fixture
-def constraint_with_ephem():
-    """Fixture for a Constraint instance with mocked ephem."""
+@pytest.fixture(scope="module")
+def _shared_constraint_with_ephem():
     c = Constraint()
     c.ephem = Mock()
     c.ephem._tle_ephem = Mock()
@@ -24,9 +25,62 @@ def constraint_with_ephem():
 
 
 @pytest.fixture
+def constraint_with_ephem(_shared_constraint_with_ephem):
+    """Fixture for a Constraint instance with mocked ephem."""
+    # The instance is shared across the module; clear calls recorded on the ephem
+    _shared_constraint_with_ephem.ephem.reset_mock()
+    return _shared_constraint_with_ephem
+
+
+@pytest.fixture
+def mock_constraint_methods():
+    """Patch the Constraint.in_* checks combined by in_constraint; yields mocks by name."""
+    with patch.multiple(
+        Constraint,
+        in_sun=DEFAULT,
+        in_anti_sun=DEFAULT,
+        in_earth=DEFAULT,
+        in_moon=DEFAULT,
+        in_panel=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
+_RUST_CONSTRAINT_CLASSES = (
+    "SunConstraint",
+    "AndConstraint",
+    "EarthLimbConstraint",
+    "MoonConstraint",
+    "EclipseConstraint",
+)
+
+
+@pytest.fixture(scope="module")
+def _patched_rust_constraints():
+    with contextlib.ExitStack() as stack:
+        yield {
+            name: stack.enter_context(
+                patch.object(getattr(rust_ephem, name), "in_constraint")
+            )
+            for name in _RUST_CONSTRAINT_CLASSES
+        }
+
+
+@pytest.fixture
+def rust_ephem_mocks(_patched_rust_constraints):
+    """Mocked in_constraint methods of the rust_ephem constraint classes, by class name."""
+    # The patches stay installed for the whole module; clear state left by earlier tests
+    for mock in _patched_rust_constraints.values():
+        mock.reset_mock(return_value=True)
+    return _patched_rust_constraints
+
+
+_TIMES = tuple(
+    datetime.fromtimestamp(t, tz=timezone.utc) for t in (1700000000.0, 1700000100.0)
+)
+
+
+@pytest.fixture(scope="session")
 def time_list():
-    """Fixture for a list of datetime objects."""
-    return [
-        datetime.fromtimestamp(1700000000.0, tz=timezone.utc),
-        datetime.fromtimestamp(1700000100.0, tz=timezone.utc),
-    ]
+    """Fixture for an immutable sequence of datetime objects."""
+    return _TIMES
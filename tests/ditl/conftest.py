@@ -1,6 +1,7 @@
 """Test fixtures for ditl subsystem tests."""
 
 import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -10,26 +11,27 @@ from matplotlib import pyplot as plt
 from conops import DITL, ACSMode
 from conops.ditl.ditl_mixin import DITLMixin
 
+# Five minutes of 60 s ephemeris steps starting 2018-11-27 00:00:00 UTC, built
+# once at import; DummyEphemeris instances share these read-only sequences.
+_UNIX_TIMES = np.arange(1543276800, 1543276800 + 5 * 60, 60)
+_UNIX_TIMES.setflags(write=False)
+_TIMESTAMPS = tuple(
+    datetime.datetime.fromtimestamp(float(t), tz=datetime.timezone.utc)
+    for t in _UNIX_TIMES
+)
+
 
 class DummyEphemeris:
     """Minimal mock ephemeris for testing."""
 
-    def __init__(self, num_steps: int = 5):
-        from datetime import datetime, timezone
-
+    def __init__(self):
         self.step_size = 60  # Use 60 second steps for faster tests
         # Create a short simulation: just a few minutes instead of 24 hours
-        start_time = 1543276800  # 2018-11-27 00:00:00 UTC
-        unix_times = np.arange(
-            start_time, start_time + num_steps * self.step_size, self.step_size
-        )
-        self.timestamp = [
-            datetime.fromtimestamp(float(t), tz=timezone.utc) for t in unix_times
-        ]
-        self.utime = unix_times
+        self.timestamp = _TIMESTAMPS
+        self.utime = _UNIX_TIMES
         # Add earth and sun attributes for ACS initialization
-        self.earth = [Mock(ra=Mock(deg=0.0), dec=Mock(deg=0.0)) for _ in unix_times]
-        self.sun = [Mock(ra=Mock(deg=45.0), dec=Mock(deg=23.5)) for _ in unix_times]
+        self.earth = [Mock(ra=Mock(deg=0.0), dec=Mock(deg=0.0)) for _ in _UNIX_TIMES]
+        self.sun = [Mock(ra=Mock(deg=45.0), dec=Mock(deg=23.5)) for _ in _UNIX_TIMES]
 
     def index(self, time):
         """Mock index method."""
@@ -54,22 +56,21 @@ def mock_config():
     return cfg
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ephem():
-    """Create a mock ephemeris object."""
+    """Create a mock ephemeris object; shared since tests only read it."""
     return DummyEphemeris()
 
 
 @pytest.fixture
-def mock_config_detailed():
+def mock_config_detailed(mock_ephem):
     """Create a mock config with all required subsystems."""
     config = Mock()
 
     # Mock constraint
     config.constraint = Mock()
-    config.constraint.ephem = DummyEphemeris()
-    config.constraint.panel_constraint = Mock()
-    config.constraint.panel_constraint.solar_panel = Mock()
+    config.constraint.ephem = mock_ephem
+    config.constraint.panel_constraint = SimpleNamespace(solar_panel=Mock())
     config.constraint.in_constraint = Mock(return_value=False)
 
     # Mock battery
@@ -83,9 +84,11 @@ def mock_config_detailed():
     # Mock spacecraft bus
     config.spacecraft_bus = Mock()
     config.spacecraft_bus.power = Mock(return_value=50.0)
-    config.spacecraft_bus.attitude_control = Mock()
-    config.spacecraft_bus.attitude_control.predict_slew = Mock(return_value=(45.0, []))
-    config.spacecraft_bus.attitude_control.slew_time = Mock(return_value=100.0)
+    # No test inspects slew prediction calls, so plain callables suffice
+    config.spacecraft_bus.attitude_control = SimpleNamespace(
+        predict_slew=lambda *args, **kwargs: (45.0, []),
+        slew_time=lambda *args, **kwargs: 100.0,
+    )
 
     # Mock payload
     config.payload = Mock()
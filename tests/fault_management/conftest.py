@@ -1,6 +1,7 @@
 """Test fixtures for fault management subsystem tests."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -19,27 +20,21 @@ from conops import (
 from conops.config.fault_management import FaultConstraint
 
 
-class DummyBattery:
-    """Simple battery mock for testing."""
-
-    def __init__(self):
-        self.charge_level = 800.0
-        self.watthour = 1000
-        self.capacity = 1000
-        self.max_depth_of_discharge = 0.6
-
-    @property
-    def battery_level(self):
-        return self.charge_level / self.watthour
-
-
 class DummyEphemeris:
     """Minimal mock ephemeris for testing."""
 
+    # Read-only positions, built once and shared by every instance
+    _EARTH = (
+        SimpleNamespace(ra=SimpleNamespace(deg=0.0), dec=SimpleNamespace(deg=0.0)),
+    )
+    _SUN = (
+        SimpleNamespace(ra=SimpleNamespace(deg=45.0), dec=SimpleNamespace(deg=23.5)),
+    )
+
     def __init__(self):
         self.step_size = 1.0
-        self.earth = [Mock(ra=Mock(deg=0.0), dec=Mock(deg=0.0))]
-        self.sun = [Mock(ra=Mock(deg=45.0), dec=Mock(deg=23.5))]
+        self.earth = DummyEphemeris._EARTH
+        self.sun = DummyEphemeris._SUN
 
     def index(self, time):
         return 0
@@ -1,5 +1,6 @@
 """Test fixtures for passes subsystem tests."""
 
+import functools
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock
 
@@ -17,42 +18,54 @@ from conops.config import (
     SpacecraftBus,
 )
 
+# Slew path returned by the mocked predict_slew; shared and read-only
+_UNIT_Z = np.array([[0.0, 0.0, 1.0]])
+_UNIT_Z.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_ephem_data(step_size, num_points):
+    """Return (timestamps, positions) for MockEphemeris; both read-only and shared."""
+    # Build num_points timestamps; the orbit period below stays fixed at 1440
+    # steps regardless of num_points
+    base_time = datetime(2018, 1, 1, tzinfo=timezone.utc)
+    timestamps = tuple(
+        base_time + timedelta(seconds=i * step_size) for i in range(num_points)
+    )
+
+    # Create position arrays (simplified orbital positions)
+    # float32 is ample for a mock circular orbit and halves the buffer size
+    angles = 2 * np.pi * np.arange(num_points) / 1440  # One orbit per 1440 steps
+    angles = angles.astype(np.float32)
+    positions = np.empty((num_points, 3), dtype=np.float32)
+    positions[:, 0] = 6900 * np.cos(angles)  # Earth radius + 550 km
+    positions[:, 1] = 6900 * np.sin(angles)
+    positions[:, 2] = 0.0
+    positions.setflags(write=False)
+    return timestamps, positions
+
 
 class MockEphemeris:
     """Mock ephemeris for testing."""
 
-    def __init__(self, step_size=60.0, num_points=1440):
+    def __init__(self, step_size=60.0, num_points=16):
         self.step_size = step_size
         self.num_points = num_points
+        self.timestamp, positions = _build_ephem_data(step_size, num_points)
 
-        # Create timestamps for one day
-        base_time = datetime(2018, 1, 1, tzinfo=timezone.utc)
-        self.timestamp = [
-            base_time + timedelta(seconds=i * step_size) for i in range(num_points)
-        ]
-
-        # Create mock gcrs_pv and itrs_pv for position data
+        # Create mock gcrs_pv and itrs_pv for position data; tests only read
+        # positions, so both frames share one array
         self.gcrs_pv = Mock()
         self.itrs_pv = Mock()
-
-        # Create position arrays (simplified orbital positions)
-        positions = []
-        for i in range(num_points):
-            angle = 2 * np.pi * i / 1440  # One orbit per day
-            x = 6900 * np.cos(angle)  # Earth radius + 550 km
-            y = 6900 * np.sin(angle)
-            z = 0
-            positions.append([x, y, z])
-
-        self.gcrs_pv.position = np.array(positions)
-        self.itrs_pv.position = np.array(positions)
+        self.gcrs_pv.position = positions
+        self.itrs_pv.position = positions
 
     def index(self, time):
         """Mock index method."""
         return 0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ephem(create_ephem):
     """Create a simple real TLE ephemeris for tests.
 
@@ -67,18 +80,16 @@ def mock_ephem(create_ephem):
 
 
 @pytest.fixture
-def mock_constraint(mock_ephem):
+def mock_constraint(mock_ephem, spec_mock):
     """Create a mock constraint."""
-    constraint = Mock(spec=Constraint)
-    constraint.ephem = mock_ephem
-    return constraint
+    return spec_mock(Constraint, ephem=mock_ephem)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_acs_config():
-    """Create a mock ACS config."""
+    """Create a mock ACS config; shared since no test inspects its calls."""
     config = Mock()
-    config.predict_slew = Mock(return_value=(10.0, np.array([[0, 0, 1]])))
+    config.predict_slew = Mock(return_value=(10.0, _UNIT_Z))
     config.slew_time = Mock(return_value=10.0)  # Add slew_time method
     return config
 
@@ -126,7 +137,7 @@ def basic_pass_mock(mock_config, create_ephem):
     return p
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ephemeris_100():
     return MockEphemeris(step_size=60.0, num_points=100)
 
@@ -171,20 +182,26 @@ def start_dec():
     return [25.0, 26.0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tle_path():
     return "examples/example.tle"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def create_ephem(tle_path):
+    # Propagating a TLE is the slow part and the result is never modified, so
+    # identical windows share one ephemeris for the whole session
+    @functools.lru_cache(maxsize=32)
+    def _propagate(begin, end, step_size):
+        return TLEEphemeris(tle=tle_path, begin=begin, end=end, step_size=step_size)
+
     def _create(begin, end, step_size=60):
         # Convert unix timestamp floats to timezone-aware datetimes if needed
         if isinstance(begin, (int, float)):
             begin = datetime.fromtimestamp(begin, tz=timezone.utc)
         if isinstance(end, (int, float)):
             end = datetime.fromtimestamp(end, tz=timezone.utc)
-        return TLEEphemeris(tle=tle_path, begin=begin, end=end, step_size=step_size)
+        return _propagate(begin, end, step_size)
 
     return _create
 
@@ -50,24 +50,29 @@ def simple_target_factory():
     return _factory
 
 
+class TimeWithTimestamp(Time):
+    """astropy Time with the datetime-style timestamp() the scheduler calls."""
+
+    def timestamp(self):
+        return float(self.unix)
+
+
+# 24 hours of data with 60-second steps from 2018-11-27 00:00:00 UTC. Building
+# 1440 Time objects is slow, so the grid is made once and shared read-only.
+_UTIME = np.arange(1543276800, 1543276800 + 86400, 60)
+_UTIME.setflags(write=False)
+_TIMESTAMPS = tuple(TimeWithTimestamp(t, format="unix") for t in _UTIME)
+# Provide datetimes list for adapter/datetimes compatibility
+_DATETIMES = tuple(datetime.fromtimestamp(int(t), tz=timezone.utc) for t in _UTIME)
+
+
 @pytest.fixture
 def mock_ephemeris():
     """Create a mock ephemeris object."""
     ephem = Mock()
-    # 24 hours of data with 60-second steps
-    start_time = 1543276800  # 2018-11-27 00:00:00 UTC
-    ephem.utime = np.arange(start_time, start_time + 86400, 60)
-
-    # Create Time objects with timestamp() method
-    class TimeWithTimestamp(Time):
-        def timestamp(self):
-            return float(self.unix)
-
-    ephem.timestamp = [TimeWithTimestamp(t, format="unix") for t in ephem.utime]
-    # Provide datetimes list for adapter/datetimes compatibility
-    ephem.datetimes = [
-        datetime.fromtimestamp(int(t), tz=timezone.utc) for t in ephem.utime
-    ]
+    ephem.utime = _UTIME
+    ephem.timestamp = _TIMESTAMPS
+    ephem.datetimes = _DATETIMES
 
     # Mock methods
     def mock_index(time_obj):
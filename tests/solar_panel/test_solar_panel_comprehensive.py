@@ -1,6 +1,7 @@
 """Additional comprehensive tests for solar_panel.py to achieve near 100% coverage."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -8,6 +9,10 @@ import pytest
 
 from conops import SolarPanel, SolarPanelSet
 
+# Eclipse evaluation result for two samples, neither in eclipse
+_NOT_IN_ECLIPSE = np.array([False, False])
+_NOT_IN_ECLIPSE.setflags(write=False)
+
 
 class TestSolarPanelSetCoverage:
     """Tests for SolarPanelSet class."""
@@ -1641,8 +1646,7 @@ class TestPowerEdgeCases:
 
         # Mock eclipse constraint for array evaluation
         mock_constraint = Mock()
-        mock_result = Mock()
-        mock_result.constraint_array = np.array([False, False])  # Not in eclipse
+        mock_result = SimpleNamespace(constraint_array=_NOT_IN_ECLIPSE)
         mock_constraint.evaluate = Mock(return_value=mock_result)
 
         with patch.object(panel, "_eclipse_constraint", mock_constraint):
@@ -1809,8 +1813,7 @@ class TestIlluminationAndPower:
 
         # Mock eclipse constraint for dummy panel shape determination
         mock_constraint = Mock()
-        mock_result = Mock()
-        mock_result.constraint_array = np.array([False, False])
+        mock_result = SimpleNamespace(constraint_array=_NOT_IN_ECLIPSE)
         mock_constraint.evaluate = Mock(return_value=mock_result)
 
         with patch("conops.SolarPanel._eclipse_constraint", mock_constraint):
@@ -1841,8 +1844,7 @@ class TestIlluminationAndPower:
 
         # Mock eclipse constraint for dummy panel shape determination
         mock_constraint = Mock()
-        mock_result = Mock()
-        mock_result.constraint_array = np.array([False, False])
+        mock_result = SimpleNamespace(constraint_array=_NOT_IN_ECLIPSE)
         mock_constraint.evaluate = Mock(return_value=mock_result)
 
         with patch("conops.SolarPanel._eclipse_constraint", mock_constraint):
@@ -1879,8 +1881,7 @@ class TestIlluminationAndPower:
 
         # Mock eclipse constraint for array evaluation
         mock_constraint = Mock()
-        mock_result = Mock()
-        mock_result.constraint_array = np.array([False, False])  # Not in eclipse
+        mock_result = SimpleNamespace(constraint_array=_NOT_IN_ECLIPSE)
         mock_constraint.evaluate = Mock(return_value=mock_result)
 
         with patch("conops.SolarPanel._eclipse_constraint", mock_constraint):
@@ -1,7 +1,9 @@
 """Tests for sky pointing visualization module."""
 
+import io
 from unittest.mock import Mock, patch
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 
@@ -217,6 +219,30 @@ class TestSkyPointingController:
         assert controller.current_time_idx == 0
         assert controller.playing is False
 
+    def test_svg_keeps_axes_vector_and_points_rasterized(self, mock_ditl):
+        """Test SVG output rasterizes point clouds but keeps text and grid vector."""
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection="mollweide")
+        controller = SkyPointingController(ditl=mock_ditl, fig=fig, ax=ax)
+        controller._plot_points_on_sky(
+            np.array([10.0, 20.0, 30.0]), np.array([0.0, 10.0, -10.0]), "red"
+        )
+        controller._setup_plot_appearance(mock_ditl.utime[0])
+
+        buffer = io.StringIO()
+        with plt.rc_context({"svg.fonttype": "none"}):
+            fig.savefig(buffer, format="svg")
+        plt.close(fig)
+        svg = buffer.getvalue()
+
+        assert svg.count("<image") == 1  # the single point cloud
+        # Title and axis labels stay selectable text
+        assert "Spacecraft Pointing at" in svg
+        assert "Declination (deg)" in svg
+        # Ticks and their gridlines stay vector groups
+        assert 'id="xtick_' in svg
+        assert 'id="ytick_' in svg
+
     @patch("conops.visualization.sky_pointing.plt")
     def test_find_time_index(self, mock_plt, mock_ditl):
         """Test finding time index."""
@@ -450,3 +476,84 @@ class TestPlotElements:
         assert mock_ax.plot.called
         # Should add a circle patch
         assert mock_ax.add_patch.called
+
+    @patch("conops.visualization.sky_pointing.plt")
+    def test_plot_earth_disk_selects_points_within_radius(self, mock_plt, mock_ditl):
+        """Test that the Earth disk contains exactly the grid points within its radius."""
+        mock_ditl.ephem = mock_ditl.constraint.ephem
+        controller = SkyPointingController(
+            ditl=mock_ditl,
+            fig=Mock(),
+            ax=Mock(),
+            n_grid_points=50,
+        )
+        controller._plot_points_on_sky = Mock()
+
+        controller._plot_earth_disk(mock_ditl.utime[0])
+
+        ra_flat, dec_flat = controller._create_sky_grid(50)
+        cos_dist = np.sin(np.radians(-15.0)) * np.sin(np.radians(dec_flat)) + np.cos(
+            np.radians(-15.0)
+        ) * np.cos(np.radians(dec_flat)) * np.cos(np.radians(ra_flat - 270.0))
+        expected = np.degrees(np.arccos(np.clip(cos_dist, -1.0, 1.0))) <= 10.0
+
+        ra_vals, dec_vals = controller._plot_points_on_sky.call_args[0][:2]
+        np.testing.assert_array_equal(ra_vals, ra_flat[expected])
+        np.testing.assert_array_equal(dec_vals, dec_flat[expected])
+
+
+class TestConstraintCache:
+    """Test pre-computed constraint cache."""
+
+    @patch("conops.visualization.sky_pointing.plt")
+    def test_precompute_constraints_cache_is_time_major(self, mock_plt, mock_ditl):
+        """Test that cached constraint masks are stored as (n_times, n_points)."""
+        controller = SkyPointingController(
+            ditl=mock_ditl,
+            fig=Mock(),
+            ax=Mock(),
+            n_grid_points=10,
+        )
+        ra_flat, _ = controller._create_sky_grid(10)
+        n_points = len(ra_flat)
+
+        result = np.zeros((n_points, 3), dtype=bool)
+        result[5, 1] = True
+        constraint_config = mock_ditl.config.constraint
+        for name in ("sun", "moon", "earth", "anti_sun", "panel"):
+            getattr(
+                constraint_config, f"{name}_constraint"
+            ).in_constraint_batch.return_value = result
+
+        controller._precompute_constraints(np.array([0, 1, 2]))
+
+        cached = controller._constraint_cache["constraints"]["sun"]
+        assert cached.shape == (3, n_points)
+        assert cached.flags["C_CONTIGUOUS"]
+        assert cached[1, 5]
+        assert cached.sum() == 1
+
+    @patch("conops.visualization.sky_pointing.plt")
+    def test_cached_constraint_does_not_rebuild_grid(self, mock_plt, mock_ditl):
+        """Test that plotting from the cache does not regenerate the sky grid."""
+        controller = SkyPointingController(
+            ditl=mock_ditl,
+            fig=Mock(),
+            ax=Mock(),
+            n_grid_points=10,
+        )
+        ra_flat, _ = controller._create_sky_grid(10)
+        sun_constraint = mock_ditl.config.constraint.sun_constraint
+        for name in ("sun", "moon", "earth", "anti_sun", "panel"):
+            getattr(
+                mock_ditl.config.constraint, f"{name}_constraint"
+            ).in_constraint_batch.return_value = np.zeros((len(ra_flat), 1), bool)
+        controller._precompute_constraints(np.array([0]))
+        assert controller._grid_signature == (10, len(ra_flat))
+
+        controller._create_sky_grid = Mock(side_effect=AssertionError)
+        controller._plot_single_constraint(
+            "Sun", sun_constraint, "yellow", mock_ditl.utime[0], 90.0, 23.5
+        )
+
+        assert sun_constraint.in_constraint_batch.call_count == 1